@@ -6,62 +6,267 @@ Takes csv files from existing City Scan tabular output and interim Scan Calculat
 
 """
 
-import pandas as pd
+import json
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
 import sys
 
-# population growth
-def clean_pg(input_file, output_file=None):
+# numpy, pandas and pyarrow are imported inside the functions that use them so that
+# the command line usage message (and modules that only import this one) start without them
+
+def _read_csv(input_file, column_types=None):
     """
-    clean up the population-growth.csv file for visualization as pg.csv.
+    read a csv file with pyarrow's multithreaded reader and hand it back as a pandas dataframe.
     
     parameters:
     -----------
     input_file : str
         Path to the input csv file
-    output_file : str, optional
+    column_types : dict, optional
+        Column name -> pyarrow type alias (e.g., 'int32', 'float64', 'string'), or 'category' for a string column
+        dictionary-encoded while parsing (read as a pandas categorical). Only these columns are read,
+        with these types (no type inference). All columns are read and inferred by default.
+    """
+    import pyarrow as pa
+    from pyarrow import csv as pacsv
+    # empty cells are missing in string columns too (as with pandas.read_csv), not ''
+    if column_types is None:
+        convert_options = pacsv.ConvertOptions(strings_can_be_null=True)
+    else:
+        convert_options = pacsv.ConvertOptions(
+            strings_can_be_null=True,
+            include_columns=list(column_types),
+            column_types={
+                name: pa.dictionary(pa.int32(), pa.string()) if alias == 'category' else pa.type_for_alias(alias)
+                for name, alias in column_types.items()
+            }
+        )
+    table = pacsv.read_csv(
+        input_file,
+        read_options=pacsv.ReadOptions(use_threads=True),
+        convert_options=convert_options
+    )
+    # the table is not used again, so let arrow free each column as it is converted
+    return table.to_pandas(split_blocks=True, self_destruct=True)
+
+def _write_csv(df, output_file):
+    """
+    write a pandas dataframe to csv with pyarrow's csv writer (no index, missing values as empty cells).
+    
+    parameters:
+    -----------
+    df : DataFrame
+        Data to write
+    output_file : str
         Path for output.
     """
+    import pyarrow as pa
+    from pyarrow import csv as pacsv
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    # buffer the whole (small) file so it is written with a single flush
+    with pa.output_stream(output_file, compression=None, buffer_size=1 << 20) as sink:
+        pacsv.write_csv(table, sink, write_options=pacsv.WriteOptions(null_string='', quoting_header='none'))
+
+# default folder for cleaned outputs, relative to the working directory
+_PROCESSED_DIR = 'data/processed'
+
+def _processed_path(filename=None):
+    """
+    default output path for filename in data/processed (the folder itself if filename is None).
+    the folder is created (again) if it does not exist, e.g. after being deleted during a notebook session.
+    """
+    os.makedirs(_PROCESSED_DIR, exist_ok=True)
+    return _PROCESSED_DIR if filename is None else os.path.join(_PROCESSED_DIR, filename)
+
+# cleaned pg / uba dataframes kept in memory, so clean_pug can skip re-reading files written in this process and
+# cleaning the same input again skips the read and transform. each entry keeps the (mtime, size) of the file it
+# stands for, so a file changed on disk since is read again. least recently used entries are dropped past _CACHE_SIZE
+_CACHE = OrderedDict()
+_CACHE_SIZE = 32
+
+def _file_signature(path):
+    """
+    (mtime, size) of path, used to tell whether a cached result is still current.
+    """
+    st = os.stat(path)
+    return (st.st_mtime_ns, st.st_size)
+
+def _cache_get(key, signature):
+    """
+    the cached dataframe for key if it was stored with this file signature, else None.
+    """
+    entry = _CACHE.get(key)
+    if entry is None or entry[0] != signature:
+        return None
+    _CACHE.move_to_end(key)
+    return entry[1]
+
+def _cache_put(key, signature, df):
+    """
+    store df under key, dropping the least recently used entries past _CACHE_SIZE.
+    """
+    _CACHE[key] = (signature, df)
+    _CACHE.move_to_end(key)
+    while len(_CACHE) > _CACHE_SIZE:
+        _CACHE.popitem(last=False)
+
+def _cache_result(output_file, df):
+    """
+    remember the dataframe just written to output_file (see _read_cleaned).
+    """
+    _cache_put(('output', os.path.abspath(output_file)), _file_signature(output_file), df.copy())
+
+def _read_cleaned(input_file, read_csv, from_pandas=None):
+    """
+    read a cleaned csv file, reusing the cached dataframe instead when the file is unchanged since it was written.
+    
+    parameters:
+    -----------
+    input_file : str
+        Path to the cleaned csv file
+    read_csv : callable
+        Reader used when there is no usable cached result.
+    from_pandas : callable, optional
+        Converts the cached (pandas) dataframe for the caller, e.g. polars.from_pandas. A copy is returned by default.
+    """
+    key = ('output', os.path.abspath(input_file))
+    if key in _CACHE:
+        df = _cache_get(key, _file_signature(input_file))
+        if df is not None:
+            return df.copy() if from_pandas is None else from_pandas(df)
+    return read_csv(input_file)
+
+def _clean_cached(input_file, engine, clean):
+    """
+    clean(input_file), reusing the result of an earlier call with the same engine while input_file is unchanged.
+    a copy is returned each time, so callers may modify it.
+    """
+    if not isinstance(input_file, (str, os.PathLike)):
+        # buffers and other file-like inputs have no file signature to check, so they are cleaned without caching
+        return clean(input_file)
+    signature = _file_signature(input_file)
+    key = ('input', os.path.abspath(input_file), engine)
+    df = _cache_get(key, signature)
+    if df is None:
+        df = clean(input_file)
+        _cache_put(key, signature, df)
+    return df.copy()
+
+def _pct_change_pct(a, decimals=None):
+    """
+    period-over-period growth percentage of a 1-d array, NaN for the first element (like Series.pct_change() * 100).
     
-    # read the population growth CSV file
-    df = pd.read_csv(input_file)
+    parameters:
+    -----------
+    a : array-like
+        Values in period order
+    decimals : int, optional
+        Round the result in place to this many decimal places.
+    """
+    import numpy as np
+    a = np.asarray(a, dtype=np.float64)
+    out = np.empty_like(a)
+    if len(a) == 0:
+        return out
+    out[0] = np.nan
+    # subtract and divide into the output slice, no temporary difference array
+    np.subtract(a[1:], a[:-1], out=out[1:])
+    with np.errstate(divide='ignore', invalid='ignore'):
+        np.divide(out[1:], a[:-1], out=out[1:])
+    out *= 100
+    if decimals is not None:
+        np.round(out, decimals, out=out)
+    return out
+
+def _min_max(series):
+    """
+    (min, max) of a numeric column for the printed summaries, from one conversion to numpy.
+    missing values are skipped like Series.min()/max(); (nan, nan) if nothing is left.
+    """
+    import numpy as np
+    values = series.to_numpy()
+    if values.dtype.kind == 'f':
+        values = values[~np.isnan(values)]
+    if values.size == 0:
+        return np.nan, np.nan
+    return values.min(), values.max()
+
+def _use_polars(engine):
+    """
+    check the requested engine name and return True if the polars fast-path should be used.
+    """
+    if engine not in ('pandas', 'polars'):
+        raise ValueError(f"Unknown engine: {engine!r} (expected 'pandas' or 'polars')")
+    return engine == 'polars'
+
+def _collect_polars(transform, input_file, column_types=None):
+    """
+    run a polars transform lazily over input_file and return the result as a pandas dataframe.
     
+    parameters:
+    -----------
+    transform : callable
+        Takes and returns a polars LazyFrame.
+    input_file : str
+        Path to the input csv file
+    column_types : dict, optional
+        Column name -> type alias, as for _read_csv. Missing values use the same markers as _read_csv (e.g., 'NA').
+    """
+    import polars as pl
+    from pyarrow import csv as pacsv
+    types = {'int8': pl.Int8, 'int16': pl.Int16, 'int32': pl.Int32, 'float64': pl.Float64, 'string': pl.String,
+             'category': pl.Categorical}
+    lf = pl.scan_csv(
+        input_file,
+        schema_overrides=None if column_types is None else {name: types[alias] for name, alias in column_types.items()},
+        null_values=list(pacsv.ConvertOptions().null_values)
+    )
+    return transform(lf).collect().to_pandas()
+
+# population growth
+
+# input columns and types read for clean_pg
+_PG_DTYPES = {'Year': 'int32', 'Population': 'float64'}
+
+def _transform_pg(df):
+    """
+    pandas transform for clean_pg.
+    """
+    import numpy as np
     # sort by year to ensure correct order
-    df = df.sort_values('Year').reset_index(drop=True)
+    df = df.sort_values('Year', kind='stable', ignore_index=True)
     
-    # create new dataframe with desired structure
-    result_df = pd.DataFrame({
-        'yearName': df['Year'],
-        'population': df['Population']
-    })
+    # give the sorted frame the desired structure in place rather than building a new one
+    df.rename(columns={'Year': 'yearName', 'Population': 'population'}, inplace=True)
     
-    # calculate population growth percentage
+    # calculate population growth percentage, rounded to 3 decimal places to match your example
     # growth percentage = ((current_year - previous_year) / previous_year) * 100
-    result_df['populationGrowthPercentage'] = result_df['population'].pct_change() * 100
-    
-    # round to 3 decimal places to match your example
-    result_df['populationGrowthPercentage'] = result_df['populationGrowthPercentage'].round(3)
-    
-    # create output filename if not provided
-    if output_file is None:
-        import os
-        # ensure the processed directory exists
-        os.makedirs('data/processed', exist_ok=True)
-        output_file = 'data/processed/pg.csv' # saves to data/processed folder
-            
-    # save the cleaned data
-    result_df.to_csv(output_file, index=False)
+    pop = df['population'].to_numpy(dtype=np.float64)
+    df['populationGrowthPercentage'] = _pct_change_pct(pop, decimals=3)
     
-    print(f"Cleaned data saved to: {output_file}")
-    print(f"Years covered: {result_df['yearName'].min()} - {result_df['yearName'].max()}")
-    print(f"Total data points: {len(result_df)}")
-    print(f"Population range: {result_df['population'].min():,} - {result_df['population'].max():,}")
-    
-    return result_df
+    return df[['yearName', 'population', 'populationGrowthPercentage']]
 
-# population age sex
-def clean_pas(input_file, output_file=None):
+def _transform_pg_pl(lf):
     """
-    clean up the population age structure csv file (i.e., 2025-02-city-country_02-process-output_tabular_city_demographics.csv) for visualization as pas.csv.
+    polars transform for clean_pg.
+    """
+    import polars as pl
+    return (
+        lf.sort('Year', nulls_last=True, maintain_order=True)  # blank years last, as in the pandas sort
+        .select(
+            pl.col('Year').alias('yearName'),
+            pl.col('Population').alias('population')
+        )
+        .with_columns(
+            (pl.col('population').pct_change() * 100).round(3).alias('populationGrowthPercentage')
+        )
+    )
+
+def clean_pg(input_file, output_file=None, engine='pandas', write=True, verbose=True):
+    """
+    clean up the population-growth.csv file for visualization as pg.csv.
     
     parameters:
     -----------
@@ -69,79 +274,138 @@ def clean_pas(input_file, output_file=None):
         Path to the input csv file
     output_file : str, optional
         Path for output.
+    engine : str, optional
+        'pandas' (default) or 'polars' to run the transform with polars.
+    write : bool, optional
+        Set to False to skip writing the output file and only return the cleaned dataframe.
+    verbose : bool, optional
+        Set to False to skip printing the summary (e.g., when cleaning many files in a batch).
     """
     
-    # read the population age structure CSV file
-    df = pd.read_csv(input_file)
-    
-    # combine 0-1 and 1-4 age brackets into 0-4
-    df['age_group'] = df['age_group'].replace({'0-1': '0-4', '1-4': '0-4'})
+    # read the population growth CSV file and transform it
+    # (reused while the input file is unchanged, e.g. when the same city is cleaned again)
+    if _use_polars(engine):
+        result_df = _clean_cached(
+            input_file, engine, lambda path: _collect_polars(_transform_pg_pl, path, column_types=_PG_DTYPES)
+        )
+    else:
+        result_df = _clean_cached(
+            input_file, engine, lambda path: _transform_pg(_read_csv(path, column_types=_PG_DTYPES))
+        )
+    
+    if write:
+        # create output filename if not provided
+        if output_file is None:
+            output_file = _processed_path('pg.csv') # saves to data/processed folder
+            
+        # save the cleaned data, keeping it in memory for clean_pug
+        _write_csv(result_df, output_file)
+        _cache_result(output_file, result_df)
+    
+        if verbose:
+            print(f"Cleaned data saved to: {output_file}")
+    if verbose:
+        first_year, last_year = _min_max(result_df['yearName'])
+        min_pop, max_pop = _min_max(result_df['population'])
+        print(f"Years covered: {first_year} - {last_year}")
+        print(f"Total data points: {len(result_df)}")
+        print(f"Population range: {min_pop:,} - {max_pop:,}")
     
-    # group by the new age brackets and sex, summing the population
-    df_grouped = df.groupby(['age_group', 'sex'], as_index=False)['population'].sum()
+    return result_df
+
+# population age sex
+
+# input columns and types read for clean_pas
+_PAS_DTYPES = {'age_group': 'category', 'sex': 'category', 'population': 'float64'}
+
+# standard age bracket order used to sort pas.csv
+_AGE_ORDER = ('0-4', '5-9', '10-14', '15-19', '20-24', '25-29', 
+              '30-34', '35-39', '40-44', '45-49', '50-54', '55-59', '60-64', 
+              '65-69', '70-74', '75-79', '80+', '80')
+
+# age bracket -> position in the standard order, used as an integer sort key
+_AGE_RANK = {bracket: i for i, bracket in enumerate(_AGE_ORDER)}
+
+def _remap_categories(values, mapping):
+    """
+    relabel a column through mapping as a categorical, so each distinct label is looked up once rather than every row.
+    labels missing from mapping are kept, and the categories stay in sorted order.
+    """
+    import numpy as np
+    import pandas as pd
+    cat = pd.Categorical(values)
+    labels = cat.categories.map(lambda label: mapping.get(label, label))
+    categories = labels.unique().sort_values()
+    # old code -> new code, with a trailing -1 so missing values (code -1) stay missing
+    lookup = np.append(categories.get_indexer(labels), -1)
+    return pd.Categorical.from_codes(lookup[cat.codes], categories)
+
+def _transform_pas(df):
+    """
+    pandas transform for clean_pas.
+    """
+    import numpy as np
+    import pandas as pd
+    # combine 0-1 and 1-4 age brackets into 0-4 and expand sex abbreviations on the categories
+    df['age_group'] = _remap_categories(df['age_group'], {'0-1': '0-4', '1-4': '0-4'})
+    df['sex'] = _remap_categories(df['sex'], {'f': 'female', 'm': 'male'})
+    
+    # group by the new age brackets and sex: one integer key per (age bracket, sex) pair from the category codes,
+    # numbered in order of first appearance and summed with a single bincount
+    age, sex = df['age_group'].cat, df['sex'].cat
+    age_codes, sex_codes = age.codes.to_numpy(), sex.codes.to_numpy()
+    valid = (age_codes >= 0) & (sex_codes >= 0)  # rows missing either label are dropped, as in groupby
+    pair = age_codes[valid].astype(np.int64) * len(sex.categories) + sex_codes[valid]
+    keys, pairs = pd.factorize(pair)
+    # missing populations count as 0, as in a groupby sum
+    pop = np.bincount(keys, weights=np.nan_to_num(df['population'].to_numpy()[valid]), minlength=len(pairs))
+    
+    # count, percentage of the total population and rounding in one numpy pass over the grouped sums
+    total_pop = pop.sum()
     
     # create new dataframe with desired structure, renaming columns appropriately
     result_df = pd.DataFrame({
-        'ageBracket': df_grouped['age_group'],
-        'sex': df_grouped['sex'].replace({'f': 'female', 'm': 'male'}),  # expand abbreviations
-        'count': df_grouped['population'].round(2),  # round to 2 decimal places
-        'percentage': (df_grouped['population'] / df_grouped['population'].sum() * 100).round(7),  # calculate percentage
+        'ageBracket': age.categories.take(pairs // len(sex.categories)).astype(str),
+        'sex': sex.categories.take(pairs % len(sex.categories)).astype(str),
+        'count': np.round(pop, 2),  # round to 2 decimal places
+        'percentage': np.round(pop / total_pop * 100, 7),  # calculate percentage
         'yearName': 2021  # assuming 2021 based on most up-to-date data from data source as noted in the Scan Calculation Sheet
-    })
+    }, copy=False)
     
     # sort by age bracket and sex for consistent ordering
-    # get all unique age brackets from the data and create a comprehensive sort order
-    unique_brackets = sorted(result_df['ageBracket'].unique())
-    
-    # create a custom sort order that includes all brackets in the data
-    age_order = ['0-4', '5-9', '10-14', '15-19', '20-24', '25-29', 
-                 '30-34', '35-39', '40-44', '45-49', '50-54', '55-59', '60-64', 
-                 '65-69', '70-74', '75-79', '80+', '80']
-    
-    # add any missing brackets from the data to the end of the order
-    for bracket in unique_brackets:
-        if bracket not in age_order:
-            age_order.append(bracket)
-    
-    # create a categorical column for proper sorting, only including categories that exist in the data
-    existing_categories = [cat for cat in age_order if cat in unique_brackets]
-    
-    try:
-        result_df['age_sort'] = pd.Categorical(result_df['ageBracket'], categories=existing_categories, ordered=True)
-        result_df = result_df.sort_values(['age_sort', 'sex']).drop('age_sort').reset_index(drop=True)
-        # remove the temporary age_sort column - ensure it's dropped
-        if 'age_sort' in result_df.columns:
-            result_df = result_df.drop('age_sort', axis=1)
-    except Exception as e:
-        print(f"⚠️  Warning: Could not sort by age bracket ({e}). Using default sorting.")
-        result_df = result_df.sort_values(['ageBracket', 'sex']).reset_index(drop=True)
-    
-   # final check to ensure age_sort column is not in the output
-    if 'age_sort' in result_df.columns:
-        result_df = result_df.drop('age_sort', axis=1)
-   
-    # create output filename if not provided
-    if output_file is None:
-        import os
-        # ensure the processed directory exists
-        os.makedirs('data/processed', exist_ok=True)
-        output_file = 'data/processed/pas.csv' # saves to data/processed folder
-            
-    # save the cleaned data
-    result_df.to_csv(output_file, index=False)
-    
-    print(f"Cleaned data saved to: {output_file}")
-    print(f"Total population: {result_df['count'].sum():,.0f}")
-    print(f"Age brackets: {result_df['ageBracket'].nunique()}")
-    print(f"Sex categories: {result_df['sex'].nunique()}")
-    print(f"Total records: {len(result_df)}")
+    # brackets missing from the standard order sort after it, keeping their input order
+    age_rank = result_df['ageBracket'].map(_AGE_RANK).fillna(len(_AGE_RANK)).to_numpy(dtype=np.int16)
+    is_male = (result_df['sex'].to_numpy() == 'male').astype(np.int8)
+    result_df = result_df.iloc[np.lexsort((is_male, age_rank))].reset_index(drop=True)
     
     return result_df
 
-# urban extent and change
-def clean_uba(input_file, output_file=None):
+def _transform_pas_pl(lf):
     """
-    clean up the urban built area csv file (i.e., 20XX-0X-country-city_other_02-process-output_tabular_city_wsf_stats.csv) for visualization as uba.csv.
+    polars transform for clean_pas.
+    """
+    import polars as pl
+    age_rank = pl.col('ageBracket').replace_strict(
+        _AGE_RANK, default=len(_AGE_RANK), return_dtype=pl.Int64
+    )
+    return (
+        lf.with_columns(pl.col('age_group').replace({'0-1': '0-4', '1-4': '0-4'}))
+        .drop_nulls(['age_group', 'sex'])  # rows missing either label are dropped, as in the pandas groupby
+        .group_by(['age_group', 'sex'], maintain_order=True)
+        .agg(pl.col('population').sum())
+        .select(
+            pl.col('age_group').cast(pl.String).alias('ageBracket'),
+            pl.col('sex').cast(pl.String).replace({'f': 'female', 'm': 'male'}),
+            pl.col('population').round(2).alias('count'),
+            (pl.col('population') / pl.col('population').sum() * 100).round(7).alias('percentage'),
+            pl.lit(2021).alias('yearName')
+        )
+        .sort(age_rank * 2 + (pl.col('sex') == 'male').cast(pl.Int64), maintain_order=True)
+    )
+
+def clean_pas(input_file, output_file=None, engine='pandas', verbose=True):
+    """
+    clean up the population age structure csv file (i.e., 2025-02-city-country_02-process-output_tabular_city_demographics.csv) for visualization as pas.csv.
     
     parameters:
     -----------
@@ -149,67 +413,141 @@ def clean_uba(input_file, output_file=None):
         Path to the input csv file
     output_file : str, optional
         Path for output.
+    engine : str, optional
+        'pandas' (default) or 'polars' to run the transform with polars.
+    verbose : bool, optional
+        Set to False to skip printing the summary (e.g., when cleaning many files in a batch).
     """
     
-    # read the urban built area CSV file
-    df = pd.read_csv(input_file)
-    
-    # sort by year to ensure correct order
-    df = df.sort_values('year').reset_index(drop=True)
-    
-    # create new dataframe with desired structure
-    result_df = pd.DataFrame({
-        'year': range(1, len(df) + 1),  # sequential numbering starting from 1
-        'yearName': df['year'],
-        'uba': df['cumulative sq km'].round(2)  # round to 2 decimal places
-    })
-    
-    # calculate urban built area growth percentage
-    # growth percentage = ((current_year - previous_year) / previous_year) * 100
-    result_df['ubaGrowthPercentage'] = result_df['uba'].pct_change() * 100
-    
-    # round to 3 decimal places to match your example
-    result_df['ubaGrowthPercentage'] = result_df['ubaGrowthPercentage'].round(3)
+    # read the population age structure CSV file and transform it
+    if _use_polars(engine):
+        result_df = _collect_polars(_transform_pas_pl, input_file, column_types=_PAS_DTYPES)
+    else:
+        result_df = _transform_pas(_read_csv(input_file, column_types=_PAS_DTYPES))
     
     # create output filename if not provided
     if output_file is None:
-        import os
-        # ensure the processed directory exists
-        os.makedirs('data/processed', exist_ok=True)
-        output_file = 'data/processed/uba.csv' # saves to data/processed folder
+        output_file = _processed_path('pas.csv') # saves to data/processed folder
             
     # save the cleaned data
-    result_df.to_csv(output_file, index=False)
+    _write_csv(result_df, output_file)
     
-    print(f"Cleaned data saved to: {output_file}")
-    print(f"Years covered: {result_df['yearName'].min()} - {result_df['yearName'].max()}")
-    print(f"Total data points: {len(result_df)}")
-    print(f"UBA range: {result_df['uba'].min():.2f} - {result_df['uba'].max():.2f} sq km")
+    if verbose:
+        print(f"Cleaned data saved to: {output_file}")
+        print(f"Total population: {result_df['count'].to_numpy().sum():,.0f}")
+        print(f"Age brackets: {result_df['ageBracket'].nunique()}")
+        print(f"Sex categories: {result_df['sex'].nunique()}")
+        print(f"Total records: {len(result_df)}")
     
     return result_df
 
-# land cover
-def clean_lc(input_file, output_file=None):
+# urban extent and change
+
+# input columns and types read for clean_uba
+_UBA_DTYPES = {'year': 'int32', 'cumulative sq km': 'float64'}
+
+def _transform_uba(df):
     """
-    clean up the 20XX-02-country-city_02-process-output_tabular_city_lc.csv file for visualization as lc.csv.
+    pandas transform for clean_uba.
+    """
+    import numpy as np
+    # sort by year to ensure correct order
+    df = df.sort_values('year', kind='stable', ignore_index=True)
+    
+    # give the sorted frame the desired structure in place rather than building a new one
+    df.rename(columns={'year': 'yearName', 'cumulative sq km': 'uba'}, inplace=True)
+    df.insert(0, 'year', np.arange(1, len(df) + 1, dtype=np.int32))  # sequential numbering starting from 1
+    uba = np.round(df['uba'].to_numpy(dtype=np.float64), 2)  # round to 2 decimal places
+    df['uba'] = uba
+    
+    # calculate urban built area growth percentage, rounded to 3 decimal places to match your example
+    # growth percentage = ((current_year - previous_year) / previous_year) * 100
+    df['ubaGrowthPercentage'] = _pct_change_pct(uba, decimals=3)
+    
+    return df[['year', 'yearName', 'uba', 'ubaGrowthPercentage']]
+
+def _transform_uba_pl(lf):
+    """
+    polars transform for clean_uba.
+    """
+    import polars as pl
+    return (
+        lf.sort('year', nulls_last=True, maintain_order=True)  # blank years last, as in the pandas sort
+        .select(
+            pl.int_range(1, pl.len() + 1, dtype=pl.Int32).alias('year'),  # sequential numbering starting from 1
+            pl.col('year').alias('yearName'),
+            pl.col('cumulative sq km').round(2).alias('uba')
+        )
+        .with_columns(
+            (pl.col('uba').pct_change() * 100).round(3).alias('ubaGrowthPercentage')
+        )
+    )
+
+def clean_uba(input_file, output_file=None, engine='pandas', write=True, verbose=True):
+    """
+    clean up the urban built area csv file (i.e., 20XX-0X-country-city_other_02-process-output_tabular_city_wsf_stats.csv) for visualization as uba.csv.
     
     parameters:
     -----------
     input_file : str
-        Path to the input csv file (land cover data)
+        Path to the input csv file
     output_file : str, optional
         Path for output.
+    engine : str, optional
+        'pandas' (default) or 'polars' to run the transform with polars.
+    write : bool, optional
+        Set to False to skip writing the output file and only return the cleaned dataframe.
+    verbose : bool, optional
+        Set to False to skip printing the summary (e.g., when cleaning many files in a batch).
     """
     
-    # read the land cover CSV file
-    df = pd.read_csv(input_file)
+    # read the urban built area CSV file and transform it
+    # (reused while the input file is unchanged, e.g. when the same city is cleaned again)
+    if _use_polars(engine):
+        result_df = _clean_cached(
+            input_file, engine, lambda path: _collect_polars(_transform_uba_pl, path, column_types=_UBA_DTYPES)
+        )
+    else:
+        result_df = _clean_cached(
+            input_file, engine, lambda path: _transform_uba(_read_csv(path, column_types=_UBA_DTYPES))
+        )
+    
+    if write:
+        # create output filename if not provided
+        if output_file is None:
+            output_file = _processed_path('uba.csv') # saves to data/processed folder
+            
+        # save the cleaned data, keeping it in memory for clean_pug
+        _write_csv(result_df, output_file)
+        _cache_result(output_file, result_df)
+    
+        if verbose:
+            print(f"Cleaned data saved to: {output_file}")
+    if verbose:
+        first_year, last_year = _min_max(result_df['yearName'])
+        min_uba, max_uba = _min_max(result_df['uba'])
+        print(f"Years covered: {first_year} - {last_year}")
+        print(f"Total data points: {len(result_df)}")
+        print(f"UBA range: {min_uba:.2f} - {max_uba:.2f} sq km")
     
+    return result_df
+
+# land cover
+
+# input columns and types read for clean_lc
+_LC_DTYPES = {'Land Cover Type': 'string', 'Pixel Count': 'float64'}
+
+def _transform_lc(df):
+    """
+    pandas transform for clean_lc.
+    """
+    import pandas as pd
     # remove rows where Pixel Count is 0 (no coverage for that land type)
-    # also remove any "total" or summary rows that might be in the data
-    df_filtered = df[
-        (df['Pixel Count'] > 0) & 
-        (~df['Land Cover Type'].str.contains('total', case=False, na=False))
-    ].copy()
+    # also remove any "total" or summary rows (e.g., "total pixel") that might be in the data
+    # plain substring match on lowercased names, no regex, combined into one numpy mask
+    is_total = df['Land Cover Type'].str.lower().str.contains('total', regex=False, na=False).to_numpy(dtype=bool)
+    mask = (df['Pixel Count'].to_numpy() > 0) & ~is_total
+    df_filtered = df[mask]
     
     # calculate total pixels for percentage calculation
     total_pixels = df_filtered['Pixel Count'].sum()
@@ -217,48 +555,119 @@ def clean_lc(input_file, output_file=None):
     # create new dataframe with desired structure
     result_df = pd.DataFrame({
         'lcType': df_filtered['Land Cover Type'],
-        'pixelCount': df_filtered['Pixel Count'].round(0).astype(int),
+        'pixelCount': pd.to_numeric(df_filtered['Pixel Count'].round(0).astype(int), downcast='integer'),
         'pixelTotal': total_pixels,
         'percentage': ((df_filtered['Pixel Count'] / total_pixels) * 100).round(2)
-    })
+    }, copy=False)
     
     # sort by percentage in descending order (most common land cover first)
-    result_df = result_df.sort_values('percentage', ascending=False).reset_index(drop=True)
+    result_df = result_df.sort_values('percentage', ascending=False, kind='stable', ignore_index=True)
+    
+    return result_df
+
+def _transform_lc_pl(lf):
+    """
+    polars transform for clean_lc.
+    """
+    import polars as pl
+    is_total = pl.col('Land Cover Type').str.to_lowercase().str.contains('total', literal=True).fill_null(False)
+    return (
+        lf.filter((pl.col('Pixel Count') > 0) & ~is_total)
+        .select(
+            pl.col('Land Cover Type').alias('lcType'),
+            pl.col('Pixel Count').round(0).cast(pl.Int64).alias('pixelCount'),
+            pl.col('Pixel Count').sum().alias('pixelTotal'),
+            (pl.col('Pixel Count') / pl.col('Pixel Count').sum() * 100).round(2).alias('percentage')
+        )
+        .sort('percentage', descending=True, maintain_order=True)
+    )
+
+def clean_lc(input_file, output_file=None, engine='pandas', verbose=True):
+    """
+    clean up the 20XX-02-country-city_02-process-output_tabular_city_lc.csv file for visualization as lc.csv.
+    
+    parameters:
+    -----------
+    input_file : str
+        Path to the input csv file (land cover data)
+    output_file : str, optional
+        Path for output.
+    engine : str, optional
+        'pandas' (default) or 'polars' to run the transform with polars.
+    verbose : bool, optional
+        Set to False to skip printing the summary (e.g., when cleaning many files in a batch).
+    """
+    
+    # read the land cover CSV file and transform it
+    if _use_polars(engine):
+        result_df = _collect_polars(_transform_lc_pl, input_file, column_types=_LC_DTYPES)
+    else:
+        result_df = _transform_lc(_read_csv(input_file, column_types=_LC_DTYPES))
     
     # create output filename if not provided
     if output_file is None:
-        import os
-        # ensure the processed directory exists
-        os.makedirs('data/processed', exist_ok=True)
-        output_file = 'data/processed/lc.csv' # saves to data/processed folder
+        output_file = _processed_path('lc.csv') # saves to data/processed folder
             
     # save the cleaned data
-    result_df.to_csv(output_file, index=False)
+    _write_csv(result_df, output_file)
     
-    print(f"Cleaned data saved to: {output_file}")
-    print(f"Land cover types: {len(result_df)}")
-    print(f"Total pixels analyzed: {total_pixels:,.0f}")
-    print(f"Percentage coverage verification: {result_df['percentage'].sum():.1f}% (should be ~100%)")
-    
-    # identify dominant land cover types
-    dominant_type = result_df.iloc[0]
-    print(f"Dominant land cover: {dominant_type['lcType']} ({dominant_type['percentage']:.1f}%)")
+    if verbose:
+        # total pixels used for the percentage calculation
+        total_pixels = result_df['pixelTotal'].iloc[0]
+        
+        print(f"Cleaned data saved to: {output_file}")
+        print(f"Land cover types: {len(result_df)}")
+        print(f"Total pixels analyzed: {total_pixels:,.0f}")
+        print(f"Percentage coverage verification: {result_df['percentage'].sum():.1f}% (should be ~100%)")
+        
+        # identify dominant land cover types
+        dominant_type = result_df.iloc[0]
+        print(f"Dominant land cover: {dominant_type['lcType']} ({dominant_type['percentage']:.1f}%)")
     
     return result_df
 
-# Command line usage
-if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        print("Usage: python clean.py input_file.csv [output_file.csv]")
-        print("Available functions: clean_pg, clean_pas, clean_pug, clean_pv, clean_flood, clean_ee, clean_lc")
-        print("For clean_pug: python clean.py pug [pg_file.csv] [uba_file.csv] [output_file.csv]")
-        print("For clean_flood: python clean.py flood_file.csv [output_directory]")
-        sys.exit(1)
+# population urban growth (urban development dynamics matrix)
+def _transform_pug(pg_df, uba_df):
+    """
+    pandas transform for clean_pug.
+    """
+    import numpy as np
+    # join pg_df and uba_df on yearName (as the index) to create pug, in pg order
+    pug_df = pg_df.set_index('yearName').join(uba_df.set_index('yearName'), how='inner').reset_index()
     
-    input_file = sys.argv[1]
+    # calculate density (population per unit area), zero area gives inf as with pandas division
+    density = np.empty(len(pug_df))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        np.divide(pug_df['population'].to_numpy(dtype=np.float64), pug_df['uba'].to_numpy(dtype=np.float64), out=density)
+    pug_df['density'] = np.round(density, 3, out=density)
+    
+    # calculate population-urban growth percentage ratio
+    # handle division by zero cases (zero UBA growth leaves the ratio as NaN)
+    num = pug_df['populationGrowthPercentage'].to_numpy(dtype=np.float64)
+    den = pug_df['ubaGrowthPercentage'].to_numpy(dtype=np.float64)
+    ratio = np.full(len(pug_df), np.nan)
+    np.divide(num, den, out=ratio, where=den != 0)
+    pug_df['populationUrbanGrowthRatio'] = np.round(ratio, 3, out=ratio)
+    
+    return pug_df
 
-# population urban growth (urban development dynamics matrix)
-def clean_pug(pg_file=None, uba_file=None, output_file=None):
+def _transform_pug_pl(pg_df, uba_df):
+    """
+    polars transform for clean_pug, returned as a pandas dataframe.
+    """
+    import polars as pl
+    growth_ratio = (pl.col('populationGrowthPercentage') / pl.col('ubaGrowthPercentage')).round(3)
+    pug_df = (
+        pg_df.join(uba_df, on='yearName', how='inner', maintain_order='left')
+        .with_columns(
+            (pl.col('population') / pl.col('uba')).round(3).alias('density'),
+            # handle division by zero cases
+            pl.when(pl.col('ubaGrowthPercentage') != 0).then(growth_ratio).alias('populationUrbanGrowthRatio')
+        )
+    )
+    return pug_df.to_pandas()
+
+def clean_pug(pg_file=None, uba_file=None, output_file=None, engine='pandas', verbose=True, pg_df=None, uba_df=None):
     """
     clean up and merge population growth (pg.csv) and urban built area (uba.csv) data 
     for visualization as pug.csv (population urban growth ratio for urban development dynamics matrix).
@@ -271,49 +680,80 @@ def clean_pug(pg_file=None, uba_file=None, output_file=None):
         Path to the urban built area CSV file (default: 'data/processed/uba.csv')
     output_file : str, optional
         Path for output (default: 'data/processed/pug.csv')
+    engine : str, optional
+        'pandas' (default) or 'polars' to run the merge with polars.
+    verbose : bool, optional
+        Set to False to skip printing the summary (e.g., when cleaning many files in a batch).
+    pg_df : DataFrame, optional
+        Cleaned population growth data already in memory (e.g., returned by clean_pg); pg_file is not read.
+    uba_df : DataFrame, optional
+        Cleaned urban built area data already in memory (e.g., returned by clean_uba); uba_file is not read.
     """
     
     # set default file paths if not provided
     if pg_file is None:
-        pg_file = 'data/processed/pg.csv'
+        pg_file = os.path.join(_PROCESSED_DIR, 'pg.csv')
     if uba_file is None:
-        uba_file = 'data/processed/uba.csv'
-    
-    # read pg.csv and uba.csv
-    try:
-        pg_df = pd.read_csv(pg_file)
-        print(f"✅ Successfully loaded population growth data: {len(pg_df)} records")
-    except FileNotFoundError:
-        raise FileNotFoundError(f"Population growth file not found: {pg_file}")
-    except Exception as e:
-        raise Exception(f"Error reading population growth file: {e}")
-    
-    try:
-        uba_df = pd.read_csv(uba_file)
-        print(f"✅ Successfully loaded urban built area data: {len(uba_df)} records")
-    except FileNotFoundError:
-        raise FileNotFoundError(f"Urban built area file not found: {uba_file}")
-    except Exception as e:
-        raise Exception(f"Error reading urban built area file: {e}")
-    
-    # merge pg_df and uba_df on yearName to create pug
-    pug_df = pd.merge(pg_df, uba_df, on='yearName', how='inner')
-    print(f"✅ Successfully merged datasets: {len(pug_df)} overlapping years")
+        uba_file = os.path.join(_PROCESSED_DIR, 'uba.csv')
     
-    if len(pug_df) == 0:
-        raise ValueError("No overlapping years found between population growth and urban built area data")
+    if _use_polars(engine):
+        import polars as pl
+        read_csv, from_pandas, transform = pl.read_csv, pl.from_pandas, _transform_pug_pl
+    else:
+        read_csv, from_pandas, transform = _read_csv, None, _transform_pug
     
-    # calculate density (population per unit area)
-    pug_df['density'] = (pug_df['population'] / pug_df['uba']).round(3)
+    # read pg.csv and uba.csv unless they were passed in (or reuse them if clean_pg / clean_uba just wrote them)
+    if pg_df is not None:
+        pg_df = pg_df if from_pandas is None else from_pandas(pg_df)
+    else:
+        try:
+            pg_df = _read_cleaned(pg_file, read_csv, from_pandas)
+            if verbose:
+                print(f"✅ Successfully loaded population growth data: {len(pg_df)} records")
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Population growth file not found: {pg_file}")
+        except Exception as e:
+            raise Exception(f"Error reading population growth file: {e}")
+    
+    if uba_df is not None:
+        uba_df = uba_df if from_pandas is None else from_pandas(uba_df)
+    else:
+        try:
+            uba_df = _read_cleaned(uba_file, read_csv, from_pandas)
+            if verbose:
+                print(f"✅ Successfully loaded urban built area data: {len(uba_df)} records")
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Urban built area file not found: {uba_file}")
+        except Exception as e:
+            raise Exception(f"Error reading urban built area file: {e}")
+    
+    return _build_pug(pg_df, uba_df, transform, output_file, verbose)
+
+def _build_pug(pg_df, uba_df, transform, output_file=None, verbose=True):
+    """
+    merge already loaded pg and uba dataframes into pug, save it and print a summary.
     
-    # calculate population-urban growth percentage ratio
-    # handle division by zero cases
-    mask = pug_df['ubaGrowthPercentage'] != 0
-    pug_df['populationUrbanGrowthRatio'] = None
-    pug_df.loc[mask, 'populationUrbanGrowthRatio'] = (
-        pug_df.loc[mask, 'populationGrowthPercentage'] / 
-        pug_df.loc[mask, 'ubaGrowthPercentage']
-    ).round(3)
+    parameters:
+    -----------
+    pg_df : DataFrame
+        Cleaned population growth data (as in pg.csv)
+    uba_df : DataFrame
+        Cleaned urban built area data (as in uba.csv)
+    transform : callable
+        _transform_pug or _transform_pug_pl, matching the type of pg_df / uba_df
+    output_file : str, optional
+        Path for output (default: 'data/processed/pug.csv')
+    verbose : bool, optional
+        Set to False to skip printing the summary.
+    """
+    
+    # merge pg_df and uba_df on yearName and calculate density and growth ratio
+    pug_df = transform(pg_df, uba_df)
+    if verbose:
+        print(f"✅ Successfully merged datasets: {len(pug_df)} overlapping years")
+    
+    if len(pug_df) == 0:
+        raise ValueError("No overlapping years found between population growth and urban built area data")
     
     # reorder columns to match expected output structure
     expected_columns = ['yearName', 'population', 'populationGrowthPercentage', 'year', 'uba', 
@@ -330,30 +770,116 @@ def clean_pug(pg_file=None, uba_file=None, output_file=None):
     
     # create output filename if not provided
     if output_file is None:
-        import os
-        # ensure the processed directory exists
-        os.makedirs('data/processed', exist_ok=True)
-        output_file = 'data/processed/pug.csv'
+        output_file = _processed_path('pug.csv')
     
     # save pug_df for population urban growth data to CSV
-    pug_df.to_csv(output_file, index=False)
+    _write_csv(pug_df, output_file)
+    
+    if verbose:
+        print(f"Cleaned data saved to: {output_file}")
+        first_year, last_year = _min_max(pug_df['yearName'])
+        min_pop, max_pop = _min_max(pug_df['population'])
+        min_uba, max_uba = _min_max(pug_df['uba'])
+        min_density, max_density = _min_max(pug_df['density'])
+        print(f"Years covered: {first_year} - {last_year}")
+        print(f"Total data points: {len(pug_df)}")
+        print(f"Population range: {min_pop:,} - {max_pop:,}")
+        print(f"UBA range: {min_uba:.2f} - {max_uba:.2f}")
+        print(f"Density range: {min_density:.1f} - {max_density:.1f}")
+        
+        # check for any missing ratios
+        missing_ratios = pug_df['populationUrbanGrowthRatio'].isna().sum()
+        if missing_ratios > 0:
+            print(f"⚠️  Note: {missing_ratios} missing growth ratios (likely due to zero UBA growth)")
+    
+    return pug_df
+
+# population, urban extent and population urban growth in one pass
+def clean_pg_uba_pug(pg_input_file, uba_input_file, output_dir=None, engine='pandas', verbose=True):
+    """
+    clean up population growth and urban built area data and merge them without re-reading the intermediate files.
+    Creates pg.csv, uba.csv and pug.csv with the same contents as running clean_pg, clean_uba and clean_pug in turn.
+    
+    parameters:
+    -----------
+    pg_input_file : str
+        Path to the population-growth.csv input file
+    uba_input_file : str
+        Path to the urban built area (wsf_stats) input file
+    output_dir : str, optional
+        Directory for output files (default: 'data/processed/')
+    engine : str, optional
+        'pandas' (default) or 'polars' to run the pg, uba and pug transforms with polars.
+    verbose : bool, optional
+        Set to False to skip printing the summary (e.g., when cleaning many files in a batch).
+    """
     
-    print(f"Cleaned data saved to: {output_file}")
-    print(f"Years covered: {pug_df['yearName'].min()} - {pug_df['yearName'].max()}")
-    print(f"Total data points: {len(pug_df)}")
-    print(f"Population range: {pug_df['population'].min():,} - {pug_df['population'].max():,}")
-    print(f"UBA range: {pug_df['uba'].min():.2f} - {pug_df['uba'].max():.2f}")
-    print(f"Density range: {pug_df['density'].min():.1f} - {pug_df['density'].max():.1f}")
+    # set default output directory
+    if output_dir is None:
+        output_dir = _processed_path()
+    else:
+        os.makedirs(output_dir, exist_ok=True)
     
-    # check for any missing ratios
-    missing_ratios = pug_df['populationUrbanGrowthRatio'].isna().sum()
-    if missing_ratios > 0:
-        print(f"⚠️  Note: {missing_ratios} missing growth ratios (likely due to zero UBA growth)")
+    # clean pg and uba, keeping both dataframes in memory for the merge
+    pg_df = clean_pg(pg_input_file, os.path.join(output_dir, 'pg.csv'), engine=engine, verbose=verbose)
+    uba_df = clean_uba(uba_input_file, os.path.join(output_dir, 'uba.csv'), engine=engine, verbose=verbose)
     
-    return pug_df
+    return clean_pug(output_file=os.path.join(output_dir, 'pug.csv'), engine=engine, verbose=verbose,
+                     pg_df=pg_df, uba_df=uba_df)
 
 # photovoltaic potential
-def clean_pv(input_file, output_file=None):
+
+# input columns and types read for clean_pv
+_PV_DTYPES = {'month': 'int8', 'max': 'float64'}
+
+# month number -> abbreviated month name, index 0 is unused so months 1-12 index directly
+_MONTHS = ('', 'Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+
+def _transform_pv(df):
+    """
+    pandas transform for clean_pv.
+    """
+    import numpy as np
+    import pandas as pd
+    # the input is one row per month, so sort and build the result directly on numpy arrays
+    # sort by month to ensure proper order
+    # (blank month cells are read as NaN and sort last)
+    month = df['month'].to_numpy()
+    order = np.argsort(month, kind='stable')
+    month = month[order]
+    
+    # look up month names, leaving blank or out-of-range months without a name
+    valid = (month >= 1) & (month <= 12)
+    month_names = pd.Series(np.take(_MONTHS, np.where(valid, month, 0).astype(np.intp))).where(valid)
+    
+    # create new dataframe with desired structure
+    # extract max values for each month to create the simplified pv.csv structure
+    result_df = pd.DataFrame({
+        'month': month,
+        'monthName': month_names,
+        'maxPv': np.round(df['max'].to_numpy()[order], 2)  # round to 2 decimal places to match expected output
+    }, copy=False)
+    
+    return result_df
+
+def _transform_pv_pl(lf):
+    """
+    polars transform for clean_pv.
+    """
+    import polars as pl
+    return (
+        lf.select(
+            pl.col('month'),
+            # blank or out-of-range months get no name
+            pl.col('month').replace_strict(
+                {i: name for i, name in enumerate(_MONTHS) if i}, default=None, return_dtype=pl.String
+            ).alias('monthName'),
+            pl.col('max').round(2).alias('maxPv')
+        )
+        .sort('month', nulls_last=True, maintain_order=True)
+    )
+
+def clean_pv(input_file, output_file=None, engine='pandas', verbose=True):
     """
     clean up the monthly-pv.csv file for visualization as pv.csv.
     
@@ -363,57 +889,60 @@ def clean_pv(input_file, output_file=None):
         Path to the input csv file (monthly-pv.csv)
     output_file : str, optional
         Path for output.
+    engine : str, optional
+        'pandas' (default) or 'polars' to run the transform with polars.
+    verbose : bool, optional
+        Set to False to skip printing the summary (e.g., when cleaning many files in a batch).
     """
+    import numpy as np
     
-    # read the monthly photovoltaic CSV file
-    df = pd.read_csv(input_file)
-    
-    # create new dataframe with desired structure
-    # extract max values for each month to create the simplified pv.csv structure
-    result_df = pd.DataFrame({
-        'month': df['month'],
-        'monthName': df['month'].map({
-            1: 'Jan', 2: 'Feb', 3: 'Mar', 4: 'Apr', 5: 'May', 6: 'Jun',
-            7: 'Jul', 8: 'Aug', 9: 'Sep', 10: 'Oct', 11: 'Nov', 12: 'Dec'
-        }),
-        'maxPv': df['max'].round(2)  # round to 2 decimal places to match expected output
-    })
-    
-    # sort by month to ensure proper order
-    result_df = result_df.sort_values('month').reset_index(drop=True)
+    # read the monthly photovoltaic CSV file and transform it
+    if _use_polars(engine):
+        result_df = _collect_polars(_transform_pv_pl, input_file, column_types=_PV_DTYPES)
+    else:
+        result_df = _transform_pv(_read_csv(input_file, column_types=_PV_DTYPES))
     
     # create output filename if not provided
     if output_file is None:
-        import os
-        # ensure the processed directory exists
-        os.makedirs('data/processed', exist_ok=True)
-        output_file = 'data/processed/pv.csv' # saves to data/processed folder
+        output_file = _processed_path('pv.csv') # saves to data/processed folder
             
     # save the cleaned data
-    result_df.to_csv(output_file, index=False)
-    
-    print(f"Cleaned data saved to: {output_file}")
-    print(f"Months covered: {len(result_df)} months (full year)")
-    print(f"PV potential range: {result_df['maxPv'].min():.2f} - {result_df['maxPv'].max():.2f}")
-    print(f"Peak month: {result_df.loc[result_df['maxPv'].idxmax(), 'monthName']} ({result_df['maxPv'].max():.2f})")
-    print(f"Lowest month: {result_df.loc[result_df['maxPv'].idxmin(), 'monthName']} ({result_df['maxPv'].min():.2f})")
-    
-    # calculate seasonal insights
-    summer_months = result_df[result_df['month'].isin([6, 7, 8])]  # Jun, Jul, Aug
-    winter_months = result_df[result_df['month'].isin([12, 1, 2])]  # Dec, Jan, Feb
-    
-    summer_avg = summer_months['maxPv'].mean()
-    winter_avg = winter_months['maxPv'].mean()
-    seasonal_variation = ((summer_avg - winter_avg) / winter_avg) * 100
-    
-    print(f"Summer average (Jun-Aug): {summer_avg:.2f}")
-    print(f"Winter average (Dec-Feb): {winter_avg:.2f}")
-    print(f"Seasonal variation: {seasonal_variation:.1f}% higher in summer")
+    _write_csv(result_df, output_file)
+    
+    if verbose:
+        print(f"Cleaned data saved to: {output_file}")
+        print(f"Months covered: {len(result_df)} months (full year)")
+        max_pv = result_df['maxPv'].to_numpy()
+        month_names = result_df['monthName'].to_numpy()
+        peak, low = int(np.nanargmax(max_pv)), int(np.nanargmin(max_pv))
+        print(f"PV potential range: {max_pv[low]:.2f} - {max_pv[peak]:.2f}")
+        print(f"Peak month: {month_names[peak]} ({max_pv[peak]:.2f})")
+        print(f"Lowest month: {month_names[low]} ({max_pv[low]:.2f})")
+        
+        # calculate seasonal insights with numpy masks on the month numbers (blank months fall in neither season)
+        month = result_df['month'].to_numpy()
+        summer_avg = result_df['maxPv'][(month >= 6) & (month <= 8)].mean()  # Jun, Jul, Aug
+        winter_avg = result_df['maxPv'][(month == 12) | ((month >= 1) & (month <= 2))].mean()  # Dec, Jan, Feb
+        seasonal_variation = ((summer_avg - winter_avg) / winter_avg) * 100
+        
+        print(f"Summer average (Jun-Aug): {summer_avg:.2f}")
+        print(f"Winter average (Dec-Feb): {winter_avg:.2f}")
+        print(f"Seasonal variation: {seasonal_variation:.1f}% higher in summer")
     
     return result_df
 
 # flooding
-def clean_flood(input_file, output_dir=None):
+
+# flood type -> input column, in reporting order
+_FLOOD_COLUMNS = {'coastal': 'coastal_2020', 'fluvial': 'fluvial_2020', 'pluvial': 'pluvial_2020', 'combined': 'comb_2020'}
+
+def _transform_flood_pl(lf):
+    """
+    polars transform for clean_flood (the per-type outputs are built from the sorted frame).
+    """
+    return lf.sort('year', nulls_last=True, maintain_order=True)  # blank years last, as in the pandas sort
+
+def clean_flood(input_file, output_dir=None, engine='pandas', verbose=True):
     """
     clean up the 20XX-0X-country-city_02-process-output_tabular_city_flood_wsf.csv file and create separate output files for each flood type.
     Creates fu.csv (fluvial), pu.csv (pluvial), cu.csv (coastal), and comb.csv (combined)
@@ -427,31 +956,36 @@ def clean_flood(input_file, output_dir=None):
         Path to the input csv file (flood data)
     output_dir : str, optional
         Directory for output files (default: 'data/processed/')
+    engine : str, optional
+        'pandas' (default) or 'polars' to read and sort the input with polars.
+    verbose : bool, optional
+        Set to False to skip printing the summary (e.g., when cleaning many files in a batch).
     """
+    import numpy as np
+    import pandas as pd
     
-    # read the flood data CSV file
-    df = pd.read_csv(input_file)
+    # read the flood data CSV file, sorted by year once to ensure correct order for every flood type
+    if _use_polars(engine):
+        df = _collect_polars(_transform_flood_pl, input_file)
+    else:
+        df = _read_csv(input_file).sort_values('year', kind='stable', ignore_index=True)
     
     # set default output directory
     if output_dir is None:
-        import os
-        output_dir = 'data/processed'
-        os.makedirs(output_dir, exist_ok=True)
+        output_dir = _processed_path()
     
-    # identify available flood types based on column names
-    available_flood_types = {}
+    # identify available flood types with set lookups on the column names
+    columns = set(df.columns)
+    available_flood_types = {
+        flood_type: column for flood_type, column in _FLOOD_COLUMNS.items() if column in columns
+    }
     
-    # check for each flood type (looking for columns ending with _2020)
-    if any('coastal_2020' in col for col in df.columns):
-        available_flood_types['coastal'] = 'coastal_2020'
-    if any('fluvial_2020' in col for col in df.columns):
-        available_flood_types['fluvial'] = 'fluvial_2020'  
-    if any('pluvial_2020' in col for col in df.columns):
-        available_flood_types['pluvial'] = 'pluvial_2020'
-    if any('comb_2020' in col for col in df.columns):
-        available_flood_types['combined'] = 'comb_2020'
+    # sequential numbering starting from 1, shared by every flood type
+    seq = np.arange(1, len(df) + 1, dtype=np.int32)
+    years = pd.to_numeric(df['year'], downcast='integer').to_numpy()  # inferred as int64, narrowed to the smallest int that fits
     
-    print(f"Available flood types: {list(available_flood_types.keys())}")
+    if verbose:
+        print(f"Available flood types: {list(available_flood_types.keys())}")
     
     created_files = []
     
@@ -469,113 +1003,226 @@ def clean_flood(input_file, output_dir=None):
             
             # create dataframe for this flood type
             result_df = pd.DataFrame({
-                'year': range(1, len(df) + 1),  # sequential numbering starting from 1
-                'yearName': df['year'],  # actual year from input
-                short_name: df[column_name].round(2)  # rounded flood values
-            })
-            
-            # sort by year to ensure correct order
-            result_df = result_df.sort_values('yearName').reset_index(drop=True)
+                'year': seq,  # sequential numbering starting from 1
+                'yearName': years,  # actual year from input
+                short_name: np.round(df[column_name].to_numpy(dtype=np.float64), 2)  # rounded flood values
+            }, copy=False)
             
             # save to CSV
             output_path = os.path.join(output_dir, filename)
-            result_df.to_csv(output_path, index=False)
+            _write_csv(result_df, output_path)
             created_files.append(filename)
             
-            print(f"✅ Created {filename}: {len(result_df)} records")
-            print(f"   Year range: {result_df['yearName'].min()} - {result_df['yearName'].max()}")
-            print(f"   {short_name.upper()} range: {result_df[short_name].min():.2f} - {result_df[short_name].max():.2f}")
-    
-    # summary report
-    print(f"\nFlood Risk Data Processing Summary:")
-    print(f"- Input file: {input_file}")
-    print(f"- Output directory: {output_dir}")
-    print(f"- Files created: {', '.join(created_files)}")
-    print(f"- Missing flood types: {set(['fluvial', 'pluvial', 'coastal', 'combined']) - set(available_flood_types.keys())}")
-    
-    # data quality insights
-    if len(available_flood_types) > 1:
-        print(f"\nFlood Risk Analysis:")
+            if verbose:
+                print(f"✅ Created {filename}: {len(result_df)} records")
+                first_year, last_year = _min_max(result_df['yearName'])
+                min_value, max_value = _min_max(result_df[short_name])
+                print(f"   Year range: {first_year} - {last_year}")
+                print(f"   {short_name.upper()} range: {min_value:.2f} - {max_value:.2f}")
+    
+    if verbose:
+        # summary report
+        print(f"\nFlood Risk Data Processing Summary:")
+        print(f"- Input file: {input_file}")
+        print(f"- Output directory: {output_dir}")
+        print(f"- Files created: {', '.join(created_files)}")
+        print(f"- Missing flood types: {set(['fluvial', 'pluvial', 'coastal', 'combined']) - set(available_flood_types.keys())}")
         
-        # compare flood types if multiple are available
-        for flood_type, column_name in available_flood_types.items():
-            avg_risk = df[column_name].mean()
-            max_risk = df[column_name].max()
-            min_risk = df[column_name].min()
-            trend = df[column_name].iloc[-1] - df[column_name].iloc[0]  # latest - earliest
+        # data quality insights
+        if len(available_flood_types) > 1:
+            print(f"\nFlood Risk Analysis:")
             
-            print(f"- {flood_type.capitalize()} flood risk:")
-            print(f"  Average: {avg_risk:.2f}, Range: {min_risk:.2f} - {max_risk:.2f}")
-            print(f"  Trend (1985-2015): {trend:+.2f} ({'+increase' if trend > 0 else 'decrease' if trend < 0 else 'stable'})")
-        
-        # identify highest risk type
-        latest_year_risks = {}
-        for flood_type, column_name in available_flood_types.items():
-            latest_year_risks[flood_type] = df[column_name].iloc[-1]
-        
-        highest_risk_type = max(latest_year_risks, key=latest_year_risks.get)
-        print(f"- Dominant risk type (2015): {highest_risk_type.capitalize()} ({latest_year_risks[highest_risk_type]:.2f})")
+            # compare flood types if multiple are available, taking each column out as an array once
+            latest_year_risks = {}
+            for flood_type, column_name in available_flood_types.items():
+                values = df[column_name].to_numpy(dtype=np.float64)
+                avg_risk = np.nanmean(values)
+                max_risk = np.nanmax(values)
+                min_risk = np.nanmin(values)
+                trend = values[-1] - values[0]  # latest - earliest
+                latest_year_risks[flood_type] = values[-1]
+                
+                print(f"- {flood_type.capitalize()} flood risk:")
+                print(f"  Average: {avg_risk:.2f}, Range: {min_risk:.2f} - {max_risk:.2f}")
+                print(f"  Trend (1985-2015): {trend:+.2f} ({'+increase' if trend > 0 else 'decrease' if trend < 0 else 'stable'})")
+            
+            # identify highest risk type
+            highest_risk_type = max(latest_year_risks.items(), key=itemgetter(1))[0]
+            print(f"- Dominant risk type (2015): {highest_risk_type.capitalize()} ({latest_year_risks[highest_risk_type]:.2f})")
     
     return created_files
 
-def clean_ee(input_file, output_file=None):
+# earthquake events
+
+# input columns and types read for clean_ee
+_EE_DTYPES = {
+    'BEGAN': 'string',
+    'distance': 'float64',
+    'eqMagnitude': 'float64',
+    'text': 'string',
+    'line1': 'string',
+    'line2': 'string',
+    'line3': 'string'
+}
+
+def _transform_ee(df):
     """
-    clean up the earthquake-events.csv file for visualization as ee.csv.
-    
-    parameters:
-    -----------
-    input_file : str
-        Path to the input csv file (earthquake-events.csv)
-    output_file : str, optional
-        Path for output.
+    pandas transform for clean_ee.
     """
+    import pandas as pd
+    # extract year from BEGAN column (format is YYYY-MM-DD), invalid dates become NaT
+    years = pd.to_datetime(df['BEGAN'], format='%Y-%m-%d', errors='coerce', cache=True).dt.year
     
-    # read the earthquake events CSV file
-    df = pd.read_csv(input_file)
-    
-    # extract year from BEGAN column (format appears to be YYYY-MM-DD)
-    df['begin_year'] = pd.to_datetime(df['BEGAN'], errors='coerce').dt.year
+    # remove rows with missing begin_year (invalid date parsing)
+    mask = years.notna()
+    df = df.loc[mask]
     
     # create new dataframe with desired structure
     result_df = pd.DataFrame({
-        'begin_year': df['begin_year'],
+        'begin_year': years[mask].astype('int16'),
         'distance': df['distance'].round(0).astype('Int64'),  # round to whole numbers, handle NaN
         'eqMagnitude': df['eqMagnitude'].round(1),  # round to 1 decimal place
         'text': df['text'],
         'line1': df['line1'],
         'line2': df['line2'], 
         'line3': df['line3']
-    })
+    }, copy=False)
     
-    # remove rows with missing begin_year (invalid date parsing)
-    result_df = result_df.dropna(subset=['begin_year'])
+    # sort by year to ensure chronological order
+    result_df = result_df.sort_values('begin_year', kind='stable', ignore_index=True)
     
-    # convert begin_year to integer
-    result_df['begin_year'] = result_df['begin_year'].astype(int)
+    return result_df
+
+def _transform_ee_pl(lf):
+    """
+    polars transform for clean_ee.
+    """
+    import polars as pl
+    begin_year = pl.col('BEGAN').str.to_date('%Y-%m-%d', strict=False).dt.year().cast(pl.Int16)
+    return (
+        lf.select(
+            begin_year.alias('begin_year'),
+            pl.col('distance').round(0).cast(pl.Int64),
+            pl.col('eqMagnitude').round(1),
+            'text', 'line1', 'line2', 'line3'
+        )
+        .filter(pl.col('begin_year').is_not_null())
+        .sort('begin_year', maintain_order=True)
+    )
+
+def clean_ee(input_file, output_file=None, engine='pandas', verbose=True):
+    """
+    clean up the earthquake-events.csv file for visualization as ee.csv.
     
-    # sort by year to ensure chronological order
-    result_df = result_df.sort_values('begin_year').reset_index(drop=True)
+    parameters:
+    -----------
+    input_file : str
+        Path to the input csv file (earthquake-events.csv)
+    output_file : str, optional
+        Path for output.
+    engine : str, optional
+        'pandas' (default) or 'polars' to run the transform with polars.
+    verbose : bool, optional
+        Set to False to skip printing the summary (e.g., when cleaning many files in a batch).
+    """
+    
+    # read the earthquake events CSV file and transform it
+    # (BEGAN is kept as text so invalid dates can be coerced)
+    if _use_polars(engine):
+        result_df = _collect_polars(_transform_ee_pl, input_file, column_types=_EE_DTYPES)
+        # polars Int64 with nulls comes back as float64, so restore the nullable integer type of the pandas path
+        result_df['distance'] = result_df['distance'].astype('Int64')
+    else:
+        result_df = _transform_ee(_read_csv(input_file, column_types=_EE_DTYPES))
     
     # create output filename if not provided
     if output_file is None:
-        import os
-        # ensure the processed directory exists
-        os.makedirs('data/processed', exist_ok=True)
-        output_file = 'data/processed/ee.csv' # saves to data/processed folder
+        output_file = _processed_path('ee.csv') # saves to data/processed folder
             
     # save the cleaned data
-    result_df.to_csv(output_file, index=False)
+    _write_csv(result_df, output_file)
     
-    print(f"Cleaned data saved to: {output_file}")
-    print(f"Earthquake events: {len(result_df)}")
-    print(f"Year range: {result_df['begin_year'].min()} - {result_df['begin_year'].max()}")
-    print(f"Magnitude range: {result_df['eqMagnitude'].min():.1f} - {result_df['eqMagnitude'].max():.1f}")
-    print(f"Distance range: {result_df['distance'].min()} - {result_df['distance'].max()} km")
+    if verbose:
+        print(f"Cleaned data saved to: {output_file}")
+        print(f"Earthquake events: {len(result_df)}")
+        first_year, last_year = _min_max(result_df['begin_year'])
+        min_magnitude, max_magnitude = _min_max(result_df['eqMagnitude'])
+        print(f"Year range: {first_year} - {last_year}")
+        print(f"Magnitude range: {min_magnitude:.1f} - {max_magnitude:.1f}")
+        print(f"Distance range: {result_df['distance'].min()} - {result_df['distance'].max()} km")
     
     return result_df
 
 # fire weather index (fwi)
-def clean_fwi(input_file, output_file=None):
+
+# ISO 8601 standard week-to-month mapping
+# Reference: ISO 8601:2004 Data elements and interchange formats
+# Source: https://www.iso.org/standard/40874.html
+# last ISO week of each month Jan-Nov, weeks 48-53 fall through to Dec
+_WEEK_BINS = [4, 9, 13, 17, 22, 26, 30, 35, 39, 43, 47]
+_MONTH_LABELS = _MONTHS[1:]
+
+# Fire Weather Index danger classification system
+# Very low: < 5.2, Low: 5.2-11.2, Moderate: 11.2-21.3, 
+# High: 21.3-38.0, Very high: 38.0-50.0, Extreme: > 50.0
+# Source: https://climate-adapt.eea.europa.eu/en/metadata/indicators/fire-weather-index-monthly-mean-1979-2019
+# lower bounds of Low through Extreme, each bound belongs to the higher level
+_DANGER_BINS = [5.2, 11.2, 21.3, 38.0, 50.0]
+_DANGER_LABELS = ['Very low', 'Low', 'Moderate', 'High', 'Very high', 'Extreme']
+
+# input columns and types read for clean_fwi
+_FWI_DTYPES = {'week': 'int32', 'pctile_95': 'float64'}
+
+def _transform_fwi(df):
+    """
+    pandas transform for clean_fwi.
+    """
+    import numpy as np
+    import pandas as pd
+    # map each week to its month in a single vectorized lookup
+    month_idx = np.searchsorted(_WEEK_BINS, df['week'].to_numpy(), side='left')
+    
+    # bin FWI values into danger levels (lower bound inclusive) with one vectorized lookup,
+    # missing values are set aside first and become 'Unknown'
+    fwi = df['pctile_95'].to_numpy(dtype=np.float64)
+    nan_mask = np.isnan(fwi)
+    danger = np.full(len(fwi), 'Unknown', dtype=object)
+    danger[~nan_mask] = np.array(_DANGER_LABELS, dtype=object)[
+        np.searchsorted(_DANGER_BINS, fwi[~nan_mask], side='right')
+    ]
+    
+    # create new dataframe with desired structure
+    result_df = pd.DataFrame({
+        'week': df['week'],
+        'monthName': np.take(_MONTH_LABELS, month_idx),
+        'fwi': df['pctile_95'].round(2),  # round to 2 decimal places to match output
+        'danger': danger
+    }, copy=False)
+    
+    # sort by week to ensure correct order
+    result_df = result_df.sort_values('week', kind='stable', ignore_index=True)
+    
+    return result_df
+
+def _transform_fwi_pl(lf):
+    """
+    polars transform for clean_fwi.
+    """
+    import polars as pl
+    return (
+        lf.select(
+            pl.col('week'),
+            # blank weeks fall in the last month, as with the pandas searchsorted lookup
+            pl.col('week').cut(_WEEK_BINS, labels=list(_MONTH_LABELS)).cast(pl.String)
+            .fill_null(_MONTH_LABELS[-1]).alias('monthName'),
+            pl.col('pctile_95').round(2).alias('fwi'),
+            pl.col('pctile_95').cut(_DANGER_BINS, labels=_DANGER_LABELS, left_closed=True)
+            .cast(pl.String).fill_null('Unknown').alias('danger')
+        )
+        .sort('week', nulls_last=True, maintain_order=True)
+    )
+
+def clean_fwi(input_file, output_file=None, engine='pandas', verbose=True):
     """
     clean up the 20XX-02-country-city_02-process-output_tabular_city_fwi.csv file for visualization as fwi.csv.
     
@@ -585,124 +1232,128 @@ def clean_fwi(input_file, output_file=None):
         Path to the input csv file (fire weather index data)
     output_file : str, optional
         Path for output.
+    engine : str, optional
+        'pandas' (default) or 'polars' to run the transform with polars.
+    verbose : bool, optional
+        Set to False to skip printing the summary (e.g., when cleaning many files in a batch).
     """
     
-    # read the fire weather index CSV file
-    df = pd.read_csv(input_file)
-    
-    # ISO 8601 standard week-to-month mapping
-    # Reference: ISO 8601:2004 Data elements and interchange formats
-    # Source: https://www.iso.org/standard/40874.html
-    def get_month_name_iso(week):
-        """ISO 8601 standard week-to-month mapping"""
-        if week <= 4:
-            return 'Jan'
-        elif week <= 9:
-            return 'Feb'  
-        elif week <= 13:
-            return 'Mar'
-        elif week <= 17:
-            return 'Apr'
-        elif week <= 22:
-            return 'May'
-        elif week <= 26:
-            return 'Jun'
-        elif week <= 30:
-            return 'Jul'
-        elif week <= 35:
-            return 'Aug'
-        elif week <= 39:
-            return 'Sep'
-        elif week <= 43:
-            return 'Oct'
-        elif week <= 47:
-            return 'Nov'
-        else:  # weeks 48-53
-            return 'Dec'
-    
-    # Fire Weather Index danger classification
-    
-    # Source: https://climate-adapt.eea.europa.eu/en/metadata/indicators/fire-weather-index-monthly-mean-1979-2019
-    def categorize_danger(fwi):
-        """
-        Fire Weather Index danger classification system
-        Very low: < 5.2, Low: 5.2-11.2, Moderate: 11.2-21.3, 
-        High: 21.3-38.0, Very high: 38.0-50.0, Extreme: > 50.0
-        """
-        if pd.isna(fwi):
-            return 'Unknown'
-        elif fwi < 5.2:
-            return 'Very low'
-        elif fwi < 11.2:
-            return 'Low'
-        elif fwi < 21.3:
-            return 'Moderate'
-        elif fwi < 38.0:
-            return 'High'
-        elif fwi < 50.0:
-            return 'Very high'
-        else:
-            return 'Extreme'
-    
-    # create new dataframe with desired structure
-    result_df = pd.DataFrame({
-        'week': df['week'],
-        'monthName': df['week'].apply(get_month_name_iso),
-        'fwi': df['pctile_95'].round(2),  # round to 2 decimal places to match output
-        'danger': df['pctile_95'].apply(categorize_danger)
-    })
-    
-    # sort by week to ensure correct order
-    result_df = result_df.sort_values('week').reset_index(drop=True)
+    # read the fire weather index CSV file and transform it
+    if _use_polars(engine):
+        result_df = _collect_polars(_transform_fwi_pl, input_file, column_types=_FWI_DTYPES)
+    else:
+        result_df = _transform_fwi(_read_csv(input_file, column_types=_FWI_DTYPES))
     
     # create output filename if not provided
     if output_file is None:
-        import os
-        # ensure the processed directory exists
-        os.makedirs('data/processed', exist_ok=True)
-        output_file = 'data/processed/fwi.csv' # saves to data/processed folder
+        output_file = _processed_path('fwi.csv') # saves to data/processed folder
             
     # save the cleaned data
-    result_df.to_csv(output_file, index=False)
+    _write_csv(result_df, output_file)
+    
+    if verbose:
+        print(f"Cleaned data saved to: {output_file}")
+        print(f"Weeks covered: {len(result_df)} weeks")
+        first_week, last_week = _min_max(result_df['week'])
+        min_fwi, max_fwi = _min_max(result_df['fwi'])
+        print(f"Week range: {first_week} - {last_week}")
+        print(f"FWI range: {min_fwi:.2f} - {max_fwi:.2f}")
+        
+        # danger level distribution
+        danger_counts = result_df['danger'].value_counts()
+        print(f"Danger level distribution:")
+        for level in ['Very low', 'Low', 'Moderate', 'High', 'Very high', 'Extreme']:
+            count = danger_counts.get(level, 0)
+            percentage = (count / len(result_df)) * 100
+            print(f"  {level}: {count} weeks ({percentage:.1f}%)")
+        
+        # seasonal fire weather analysis using ISO standard
+        seasonal_stats = result_df.groupby('monthName')['fwi'].agg(['mean', 'max']).round(2)
+        peak_month = seasonal_stats['max'].idxmax()
+        peak_fwi = seasonal_stats['max'].max()
+        
+        print(f"Peak fire weather month: {peak_month} (max FWI: {peak_fwi:.2f})")
+    
+    return result_df
+
+# batch processing
+_BATCH_FUNCTIONS = {
+    'clean_pg': clean_pg,
+    'clean_pas': clean_pas,
+    'clean_uba': clean_uba,
+    'clean_lc': clean_lc,
+    'clean_pug': clean_pug,
+    'clean_pg_uba_pug': clean_pg_uba_pug,
+    'clean_pv': clean_pv,
+    'clean_flood': clean_flood,
+    'clean_ee': clean_ee,
+    'clean_fwi': clean_fwi
+}
+
+def _dispatch(task):
+    """
+    run a single batch manifest entry in a worker process, without the per-file summary.
+    """
+    func = _BATCH_FUNCTIONS[task['func']]
+    inputs = task['input'] if isinstance(task['input'], list) else [task['input']]
+    func(*inputs, task.get('output'), verbose=False)
+
+def run_batch(manifest_file, max_workers=None):
+    """
+    run many independent clean_* calls (e.g., every dataset for many cities) in parallel worker processes.
     
-    print(f"Cleaned data saved to: {output_file}")
-    print(f"Weeks covered: {len(result_df)} weeks")
-    print(f"Week range: {result_df['week'].min()} - {result_df['week'].max()}")
-    print(f"FWI range: {result_df['fwi'].min():.2f} - {result_df['fwi'].max():.2f}")
+    parameters:
+    -----------
+    manifest_file : str
+        Path to a json file listing tasks as {"func": "clean_pg", "input": "...", "output": "..."}.
+        "input" is a list for functions with two inputs (clean_pug, clean_pg_uba_pug); "output" is optional
+        and is the output directory for clean_flood and clean_pg_uba_pug.
+        Tasks run in no particular order, so use clean_pg_uba_pug rather than clean_pug on freshly cleaned data.
+    max_workers : int, optional
+        Number of worker processes (default: number of CPUs).
+    """
     
-    # danger level distribution
-    danger_counts = result_df['danger'].value_counts()
-    print(f"Danger level distribution:")
-    for level in ['Very low', 'Low', 'Moderate', 'High', 'Very high', 'Extreme']:
-        count = danger_counts.get(level, 0)
-        percentage = (count / len(result_df)) * 100
-        print(f"  {level}: {count} weeks ({percentage:.1f}%)")
+    with open(manifest_file) as f:
+        tasks = json.load(f)
     
-    # seasonal fire weather analysis using ISO standard
-    seasonal_stats = result_df.groupby('monthName')['fwi'].agg(['mean', 'max']).round(2)
-    peak_month = seasonal_stats['max'].idxmax()
-    peak_fwi = seasonal_stats['max'].max()
+    # check every task up front so a typo fails before any work starts
+    unknown = sorted({task['func'] for task in tasks} - set(_BATCH_FUNCTIONS))
+    if unknown:
+        raise ValueError(f"Unknown functions in batch manifest: {unknown}")
     
-    print(f"Peak fire weather month: {peak_month} (max FWI: {peak_fwi:.2f})")
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(_dispatch, tasks, chunksize=8))
     
-    return result_df
+    print(f"Batch complete: {len(tasks)} tasks from {manifest_file}")
 
 # Command line usage
 if __name__ == "__main__":
     if len(sys.argv) < 2:
         print("Usage: python clean.py input_file.csv [output_file.csv]")
         print("Available functions: clean_pg, clean_pas, clean_uba, clean_lc, clean_pug, clean_pv, clean_flood, clean_ee, clean_fwi")
+        print("For pg, uba and pug in one pass: python clean.py population-growth.csv wsf_stats.csv [output_directory]")
+        print("For many files in parallel: python clean.py --batch manifest.json")
         sys.exit(1)
     
+    if sys.argv[1] == '--batch':
+        if len(sys.argv) < 3:
+            print("Usage: python clean.py --batch manifest.json")
+            sys.exit(1)
+        run_batch(sys.argv[2])
+        sys.exit(0)
+    
     input_file = sys.argv[1]
     output_file = sys.argv[2] if len(sys.argv) > 2 else None
     
     # determine which function to call based on filename or additional argument
-    if 'population-growth' in input_file:
+    if 'population-growth' in input_file and output_file is not None and 'wsf_stats' in output_file:
+        # both pg and uba inputs given: python clean.py population-growth.csv wsf_stats.csv [output_directory]
+        clean_pg_uba_pug(input_file, output_file, sys.argv[3] if len(sys.argv) > 3 else None)
+    elif 'population-growth' in input_file:
         clean_pg(input_file, output_file)
     elif 'demographics' in input_file:
         clean_pas(input_file, output_file)
-    elif 'wsft_stats' in input_file:
+    elif 'wsf_stats' in input_file:
         clean_uba(input_file, output_file)
     elif 'pug' in input_file:
         clean_pug(input_file, output_file)